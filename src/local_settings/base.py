@@ -18,7 +18,10 @@ class Base:
         self.original_file_name = original_file_name
         self.file_name = file_name
         self.section = section
-        # Registry of local settings with a value in the settings file
+        # Registry of local settings with a value in the settings file.
+        # Maps local settings to their dotted names. Local settings are
+        # hashed by identity, so setting their values while they're in
+        # the registry is safe.
         self.registry = {} if registry is None else registry
         self.strategy_type = strategy_type
         self.strategy = strategy_type()
@@ -61,10 +61,12 @@ class Checker(Base):
         return True
 
     def _populate_registry(self, obj, prefix=None):
-        if isinstance(obj, Mapping):
+        if isinstance(obj, (dict, Mapping)):
             items = obj.items()
-        elif isinstance(obj, Sequence) and not isinstance(obj, str):
-            items = zip(range(len(obj)), obj)
+        elif isinstance(obj, (list, tuple)) or (
+            isinstance(obj, Sequence) and not isinstance(obj, str)
+        ):
+            items = enumerate(obj)
         else:
             return
         for k, v in items:
@@ -75,10 +77,12 @@ class Checker(Base):
                 self.registry[v] = name
 
     def _check(self, obj, prefix, settings_to_write, missing):
-        if isinstance(obj, Mapping):
+        if isinstance(obj, (dict, Mapping)):
             items = sorted(obj.items(), key=lambda item: item[0])
-        elif isinstance(obj, Sequence) and not isinstance(obj, str):
-            items = zip(range(len(obj)), obj)
+        elif isinstance(obj, (list, tuple)) or (
+            isinstance(obj, Sequence) and not isinstance(obj, str)
+        ):
+            items = enumerate(obj)
         else:
             return {}, {}
 
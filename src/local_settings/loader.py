@@ -1,5 +1,6 @@
 import os
 from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from functools import lru_cache
 
 from django.utils.module_loading import import_string
 
@@ -11,6 +12,11 @@ from .types import EnvSetting, LocalSetting
 from .util import load_dotenv
 
 
+# The same IMPORT_FROM_STRING paths tend to be imported repeatedly (e.g.,
+# when settings are loaded more than once per process), so cache them.
+cached_import_string = lru_cache(maxsize=1024)(import_string)
+
+
 class Loader(Base):
     def __init__(self, file_name, section=None, registry=None, strategy_type=None):
         super().__init__(file_name, section, registry, strategy_type)
@@ -63,21 +69,23 @@ class Loader(Base):
 
         # The fully resolved settings.
         settings = Settings(base_settings)
+        set_dotted = settings.set_dotted
+        get_base_setting = base_settings.get_dotted
 
         for name, value in settings_from_file.items():
-            for prefix in ("PREPEND.", "APPEND.", "SWAP."):
-                if name.startswith(prefix):
-                    name = name[len(prefix) :]
-                    name = f"{prefix}({name})"
-                    break
+            # Note: Most names won't have one of these prefixes, so
+            # check for all of them at once.
+            if name.startswith(("PREPEND.", "APPEND.", "SWAP.")):
+                prefix, name = name.split(".", 1)
+                name = f"{prefix}.({name})"
 
-            settings.set_dotted(name, value)
+            set_dotted(name, value)
 
             # See if this setting corresponds to a `LocalSetting`. If
             # so, note that the `LocalSetting` has a value by putting it
             # in the registry. This also makes it easy to retrieve the
             # `LocalSetting` later so its value can be set.
-            current_value = base_settings.get_dotted(name, None)
+            current_value = get_base_setting(name, None)
             if isinstance(current_value, LocalSetting):
                 self.registry[current_value] = name
 
@@ -113,6 +121,9 @@ class Loader(Base):
         return settings
 
     # Post-processing
+    #
+    # Where a setting's value is replaced, the replacement is done via
+    # a get_dotted() action so the setting is only traversed to once.
 
     def _interpolate_values(self, obj, settings):
         def inject(_name, value):
@@ -123,14 +134,25 @@ class Loader(Base):
                 if isinstance(value, RawValue):
                     new_value = RawValue(new_value)
                 interpolated.append((value, new_value))
+            if "{{" in new_value:
+                state["unresolved"] = True
+            if isinstance(new_value, RawValue):
+                state["has_raw_values"] = True
             return new_value
 
+        # Another pass is only needed when something was interpolated
+        # *and* some value still contains an interpolation group; if no
+        # values contain a group, another pass wouldn't change anything.
         while True:
             interpolated = []
+            state = {"unresolved": False, "has_raw_values": False}
             obj = self._traverse_object(None, obj, action=inject)
-            if not interpolated:
+            if not (interpolated and state["unresolved"]):
                 break
 
+        if not state["has_raw_values"]:
+            return obj
+
         def decode(_name, value):
             if isinstance(value, RawValue):
                 value = self.strategy.decode_value(value)
@@ -141,11 +163,18 @@ class Loader(Base):
     def _traverse_object(self, name, obj, action):
         if isinstance(obj, (str, LocalSetting)):
             obj = action(name, obj)
-        elif isinstance(obj, MutableMapping):
+        elif obj is None or isinstance(obj, (int, float)):
+            # Skip the relatively slow ABC checks below for scalars.
+            pass
+        elif isinstance(obj, (dict, MutableMapping)):
             for k, v in obj.items():
                 n = f"{name}.{k}" if name else k
-                v = self._traverse_object(n, v, action)
-                obj[k] = v
+                new_v = self._traverse_object(n, v, action)
+                # Only reassign when the value actually changed;
+                # reassigning a nested mapping to a Settings object
+                # would otherwise copy it.
+                if new_v is not v:
+                    obj[k] = new_v
         elif isinstance(obj, Mapping):
             items = []
             for k, v in obj.items():
@@ -153,12 +182,13 @@ class Loader(Base):
                 v = self._traverse_object(n, v, action)
                 items.append((k, v))
             obj = obj.__class__(items)
-        elif isinstance(obj, MutableSequence):
+        elif isinstance(obj, (list, MutableSequence)):
             for i, v in enumerate(obj):
                 n = f"{name}.{i}" if name else str(i)
-                v = self._traverse_object(n, v, action)
-                obj[i] = v
-        elif isinstance(obj, Sequence):
+                new_v = self._traverse_object(n, v, action)
+                if new_v is not v:
+                    obj[i] = new_v
+        elif isinstance(obj, (tuple, Sequence)):
             items = []
             for i, v in enumerate(obj):
                 n = f"{name}.{i}" if name else str(i)
@@ -168,42 +198,66 @@ class Loader(Base):
         return obj
 
     def _interpolate_keys(self, obj, settings):
-        if isinstance(obj, Mapping):
-            replacements = {}
-            for k, v in obj.items():
-                if isinstance(k, str):
-                    new_k, changed = self._inject(k, settings)
-                    if changed:
-                        replacements[k] = new_k
-                self._interpolate_keys(v, settings)
-            for k, new_k in replacements.items():
-                obj[new_k] = obj[k]
-                del obj[k]
-        elif isinstance(obj, Sequence) and not isinstance(obj, str):
-            for item in obj:
-                self._interpolate_keys(item, settings)
+        # This walks ``obj`` using an explicit stack rather than
+        # recursion. Entries are pushed in reverse so they're processed
+        # in the same order as a recursive walk would process them: each
+        # key is interpolated just before its value is walked, and keys
+        # are replaced after all of a mapping's values have been walked.
+        stack = [("walk", obj, None)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            op, obj, arg = pop()
+            if op == "inject":
+                # obj is a replacements dict; arg is a key
+                new_k, changed = self._inject(arg, settings)
+                if changed:
+                    obj[arg] = new_k
+            elif op == "replace":
+                # obj is a mapping; arg is its replacements dict
+                for k, new_k in arg.items():
+                    obj[new_k] = obj[k]
+                    del obj[k]
+            elif isinstance(obj, (dict, Mapping)):
+                replacements = {}
+                push(("replace", obj, replacements))
+                for k, v in reversed(list(obj.items())):
+                    push(("walk", v, None))
+                    if isinstance(k, str):
+                        push(("inject", replacements, k))
+            elif isinstance(obj, (list, tuple)) or (
+                isinstance(obj, Sequence) and not isinstance(obj, str)
+            ):
+                for item in reversed(obj):
+                    push(("walk", item, None))
 
     def _prepend_extras(self, settings, extras):
         if not extras:
             return
-        for name, extra_val in extras.items():
-            if not extra_val:
-                continue
-            current_val = settings.get_dotted(name)
-            if not isinstance(current_val, Sequence):
+
+        def prepend(obj, segment):
+            current_val = obj[segment]
+            if not isinstance(current_val, (list, tuple, Sequence)):
                 raise TypeError("PREPEND only works with list-type settings")
-            settings.set_dotted(name, extra_val + current_val)
+            obj[segment] = extra_val + current_val
+
+        for name, extra_val in extras.items():
+            if extra_val:
+                settings.get_dotted(name, action=prepend)
 
     def _append_extras(self, settings, extras):
         if not extras:
             return
-        for name, extra_val in extras.items():
-            if not extra_val:
-                continue
-            current_val = settings.get_dotted(name)
-            if not isinstance(current_val, Sequence):
+
+        def append(obj, segment):
+            current_val = obj[segment]
+            if not isinstance(current_val, (list, tuple, Sequence)):
                 raise TypeError("APPEND only works with list-type settings")
-            settings.set_dotted(name, current_val + extra_val)
+            obj[segment] = current_val + extra_val
+
+        for name, extra_val in extras.items():
+            if extra_val:
+                settings.get_dotted(name, action=append)
 
     def _swap_list_items(self, settings, swap):
         if not swap:
@@ -212,19 +266,23 @@ class Loader(Base):
             if not swap_map:
                 continue
             current_val = settings.get_dotted(name)
-            if not isinstance(current_val, Sequence):
+            if not isinstance(current_val, (list, tuple, Sequence)):
                 raise TypeError("SWAP only works with list-type settings")
             for old_item, new_item in swap_map.items():
                 k = current_val.index(old_item)
                 current_val[k] = new_item
 
-    def _import_from_string(self, settings, import_from_string):
-        if not import_from_string:
+    def _import_from_string(self, settings, names):
+        if not names:
             return
-        for name in import_from_string:
-            current_val = settings.get_dotted(name)
+
+        def import_from_string(obj, segment):
+            current_val = obj[segment]
             if isinstance(current_val, str):
-                settings.set_dotted(name, import_string(current_val))
+                obj[segment] = cached_import_string(current_val)
+
+        for name in names:
+            settings.get_dotted(name, action=import_from_string)
 
     def _delete_settings(self, settings, names):
         if names:
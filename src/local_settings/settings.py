@@ -1,9 +1,191 @@
 import re
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from sys import intern
 
 from .util import NO_DEFAULT, NO_DEFAULT as PLACEHOLDER
 
 
+# Path tokens: {{, }}, a (...) group with no nested parentheses, a run
+# of non-delimiter chars, or any other single char (., (, ), or a lone
+# { or }).
+_path_token_re = re.compile(r"\{\{|\}\}|\([^()]*\)|[^.(){}]+|.", re.DOTALL)
+
+# A path with a single segment that doesn't look like an int and has no
+# (...) or {{ ... }} groups.
+_simple_path_re = re.compile(r"[^\d.(){}][^.(){}]*", re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def parse_path(path):
+    """Parse ``path`` into segments.
+
+    Paths must start with a WORD (i.e., a top level Django setting
+    name). Path segments are separated by dots. Compound path
+    segments (i.e., a name with a dot in it) can be grouped inside
+    parentheses.
+
+    Examples::
+
+        >>> parse_path('WORD')
+        ('WORD',)
+        >>> parse_path('WORD.x')
+        ('WORD', 'x')
+        >>> parse_path('WORD.(x)')
+        ('WORD', 'x')
+        >>> parse_path('WORD.(x.y)')
+        ('WORD', 'x.y')
+        >>> parse_path('WORD.(x.y).z')
+        ('WORD', 'x.y', 'z')
+        >>> parse_path('WORD.0.z')
+        ('WORD', 0, 'z')
+        >>> parse_path('WORD.(0).z')
+        ('WORD', '0', 'z')
+        >>> parse_path('WORD.(0)X.z')
+        ('WORD', '0X', 'z')
+
+    An example of where compound names are actually useful is in
+    logger settings::
+
+        LOGGING.loggers.(package.module).handlers = ["console"]
+        LOGGING.loggers.(package.module).level = "DEBUG"
+
+    Paths may also contain interpolation groups. Dotted names in
+    these groups will not be split (so there's no need to group them
+    inside parentheses)::
+
+        >>> parse_path('WORD.{{ x }}')
+        ('WORD', '{{ x }}')
+        >>> parse_path('WORD.{{ x.y }}')
+        ('WORD', '{{ x.y }}')
+        >>> parse_path('WORD.{{ x.y.z }}XYZ')
+        ('WORD', '{{ x.y.z }}XYZ')
+
+    Interpolation groups *can* be wrapped in parentheses, but doing
+    so is redundant::
+
+        >>> parse_path('WORD.({{ x.y.z }}XYZ)')
+        ('WORD', '{{ x.y.z }}XYZ')
+
+    Any segment that A) looks like an int and B) is *not* within
+    a (...) or {{ ... }} group will be converted to an int. Segments
+    that start with a leading "0" followed by other digits will not
+    be converted.
+
+    Results are cached since the same paths tend to be parsed over and
+    over again. Segments are returned as a tuple so the cached results
+    can't be modified.
+
+    """
+    if not path:
+        raise ValueError("path cannot be empty")
+
+    if "(" not in path and "{" not in path and "}" not in path:
+        # Fast path for plain dotted paths, which are the most common.
+        segments = path.split(".")
+        if not segments[-1]:
+            # Like below, a trailing dot doesn't add an empty segment.
+            segments.pop()
+        # Only segments starting with a digit can be converted to ints.
+        # Other segments are interned since they're used as keys.
+        return tuple(
+            convert_name(segment) if segment[:1].isdecimal() else intern(segment)
+            for segment in segments
+        )
+
+    collector = []
+    segments = []
+    group = False
+    depth = 0  # Depth of nested {{ ... }} groups
+
+    # Tokens are either delimiters or runs of non-delimiter chars, so
+    # most segments are collected as a single token.
+    tokens = iter(_path_token_re.findall(path))
+
+    for token in tokens:
+        if token == "." and not depth:
+            segments.append(_make_segment(collector, group))
+            collector = []
+            group = False
+        elif token[0] == "(" and token != "(":
+            # Simple (...) group; most groups don't contain parentheses,
+            # so this avoids consuming groups token by token.
+            if len(token) > 2:
+                collector.append(token[1:-1])
+            group = True
+        elif token == "(":
+            # Consume everything inside outer parentheses, including
+            # inner parentheses.
+            paren_depth = 1
+            for token in tokens:
+                if token == "(":
+                    paren_depth += 1
+                elif token == ")":
+                    paren_depth -= 1
+                    if not paren_depth:
+                        group = True
+                        break
+                # Add token here so outer right paren isn't collected.
+                collector.append(token)
+            else:
+                raise ValueError("Unclosed (...) in %s" % path)
+        elif token == "{{":
+            depth += 1
+            collector.append(token)
+        elif token == "}}":
+            if not depth:
+                raise ValueError("Unclosed {{ ... }} in %s" % path)
+            depth -= 1
+            collector.append(token)
+            group = True
+        else:
+            collector.append(token)
+
+    if depth:
+        raise ValueError("Unclosed {{...}} in %s" % path)
+
+    if collector:
+        segments.append(_make_segment(collector, group))
+
+    return tuple(segments)
+
+
+def _make_segment(collector, group):
+    segment = "".join(collector)
+    return segment if group else convert_name(segment)
+
+
+def is_simple_path(path):
+    """Check whether ``path`` is a single, non-int segment.
+
+    Such paths refer directly to a top level item, so they can be
+    looked up without being parsed.
+
+    >>> is_simple_path('DEBUG')
+    True
+    >>> is_simple_path('LOGGING.version')
+    False
+    >>> is_simple_path('0')
+    False
+
+    """
+    return _simple_path_re.fullmatch(path) is not None
+
+
+def convert_name(name):
+    """Convert ``name`` to int if it looks like an int.
+
+    Otherwise, return it as is.
+
+    """
+    # Note: str.isdecimal() matches the same characters as \d but
+    # avoids the overhead of a regex search for every segment. Strings
+    # beginning with "0" (other than "0" itself) aren't treated as ints.
+    if name.isdecimal() and (name[0] != "0" or name == "0"):
+        return int(name)
+    return name
+
+
 class DottedAccessMixin:
 
     """Provides dotted access to nested items in dict-like containers.
@@ -50,22 +232,55 @@ class DottedAccessMixin:
     """
 
     def contains_dotted(self, name):
-        try:
-            self._traverse(name)
-        except KeyError:
-            return False
+        if is_simple_path(name):
+            return name in self
+        # Check each segment explicitly rather than traversing and
+        # catching KeyError. This also means an out of range index
+        # results in False rather than an IndexError.
+        obj = self
+        segments = parse_path(name)
+        last = len(segments) - 1
+        for i, segment in enumerate(segments):
+            if isinstance(obj, (dict, Mapping)):
+                if segment not in obj:
+                    return False
+            elif isinstance(obj, (list, tuple, Sequence)):
+                if not isinstance(segment, int) or segment >= len(obj):
+                    return False
+            else:
+                # Other types that support item access can only be
+                # checked by trying to get the item.
+                try:
+                    obj = obj[segment]
+                except (KeyError, IndexError, TypeError):
+                    return False
+                continue
+            if i < last:
+                obj = obj[segment]
         return True
 
     def get_dotted(self, name, default=NO_DEFAULT, action=None):
         try:
-            return self._traverse(name, action=action)
+            if action is not None:
+                return self._traverse(name, action=action)
+            if is_simple_path(name):
+                return self[name]
+            obj, segment = self._resolve(name)
+            return obj[segment]
         except KeyError:
             if default is NO_DEFAULT:
                 raise
             return default
 
     def set_dotted(self, name, value, create_missing=True):
-        self._traverse(name, create_missing=create_missing, value=value)
+        if is_simple_path(name) and (create_missing or name in self):
+            self[name] = value
+            return
+        obj, segment = self._resolve(name, create_missing)
+        if not create_missing:
+            # Raise if the item doesn't already exist.
+            obj[segment]
+        obj[segment] = value
 
     def pop_dotted(self, name, default=NO_DEFAULT):
         action = lambda obj, segment: obj.pop(segment)
@@ -83,28 +298,49 @@ class DottedAccessMixin:
         be used. See :meth:`_create_segment` for more info.
 
         """
-        obj = self
-        segments = self._parse_path(name)
+        obj, segment = self._resolve(name, create_missing)
 
-        for segment, next_segment in zip(segments, segments[1:] + [None]):
-            last = next_segment is None
+        # This will raise if the item is missing (KeyError or IndexError
+        # depending on the type of container).
+        current_value = obj[segment]
 
-            if create_missing:
-                self._create_segment(obj, segment, next_segment)
+        if action:
+            value = action(obj, segment)
+        elif value is not NO_DEFAULT:
+            obj[segment] = value
+        else:
+            value = current_value
 
-            next_obj = obj[segment]
+        return value
 
-            if not last:
-                obj = next_obj
-            else:
-                if action:
-                    value = action(obj, segment)
-                elif value is not NO_DEFAULT:
-                    obj[segment] = value
-                else:
-                    value = obj[segment]
+    def _resolve(self, name, create_missing=False):
+        """Resolve ``name`` to its container and last segment.
 
-        return value
+        Returns a ``(container, segment)`` pair such that
+        ``container[segment]`` is the ``name``d item. The item itself
+        isn't accessed here, so it may not exist unless
+        ``create_missing=True`` is passed.
+
+        """
+        obj = self
+        segments = parse_path(name)
+        last = len(segments) - 1
+
+        for i in range(last):
+            segment = segments[i]
+            # Note: In the common case, obj is a dict that already
+            # contains the segment, so check that first to avoid the
+            # slower type checks in _create_segment().
+            if create_missing and not (isinstance(obj, dict) and segment in obj):
+                self._create_segment(obj, segment, segments[i + 1])
+            obj = obj[segment]
+
+        segment = segments[last]
+
+        if create_missing and not (isinstance(obj, dict) and segment in obj):
+            self._create_segment(obj, segment, None)
+
+        return obj, segment
 
     def _create_segment(self, obj, segment, next_segment):
         """Create ``obj[segment]`` if missing.
@@ -112,173 +348,48 @@ class DottedAccessMixin:
         The default value for a missing segment is based on the *next*
         segment, unless a ``default`` is explicitly passed.
 
-        If the next segment is an int, the default will be a list with
-        the indicated number of items. Otherwise the default will be
+        If the next segment is an int, the default will be an empty list,
+        which will be extended to hold the indicated number of items
+        when the next segment is created. Otherwise the default will be
         a :class:`Settings` dict.
 
         """
-        if isinstance(next_segment, int):
-            value = [PLACEHOLDER] * (next_segment + 1)
-        else:
-            value = Settings()
-        if isinstance(obj, Mapping):
-            if segment not in obj:
-                obj[segment] = value
-        elif isinstance(obj, Sequence):
+        if isinstance(obj, (dict, Mapping)):
+            if segment in obj:
+                return
+        elif isinstance(obj, (list, Sequence)):
             old_len = len(obj)
             new_len = segment + 1
             if new_len > old_len:
                 obj.extend([PLACEHOLDER] * (new_len - old_len))
-            if obj[segment] is PLACEHOLDER:
-                obj[segment] = value
-
-    def _parse_path(self, path):
-        """Parse ``path`` into segments.
-
-        Paths must start with a WORD (i.e., a top level Django setting
-        name). Path segments are separated by dots. Compound path
-        segments (i.e., a name with a dot in it) can be grouped inside
-        parentheses.
-
-        Examples::
-
-            >>> settings = Settings()
-            >>> settings._parse_path('WORD')
-            ['WORD']
-            >>> settings._parse_path('WORD.x')
-            ['WORD', 'x']
-            >>> settings._parse_path('WORD.(x)')
-            ['WORD', 'x']
-            >>> settings._parse_path('WORD.(x.y)')
-            ['WORD', 'x.y']
-            >>> settings._parse_path('WORD.(x.y).z')
-            ['WORD', 'x.y', 'z']
-            >>> settings._parse_path('WORD.0.z')
-            ['WORD', 0, 'z']
-            >>> settings._parse_path('WORD.(0).z')
-            ['WORD', '0', 'z']
-            >>> settings._parse_path('WORD.(0)X.z')
-            ['WORD', '0X', 'z']
-
-        An example of where compound names are actually useful is in
-        logger settings::
-
-            LOGGING.loggers.(package.module).handlers = ["console"]
-            LOGGING.loggers.(package.module).level = "DEBUG"
-
-        Paths may also contain interpolation groups. Dotted names in
-        these groups will not be split (so there's no need to group them
-        inside parentheses)::
-
-            >>> settings = Settings()
-            >>> settings._parse_path('WORD.{{ x }}')
-            ['WORD', '{{ x }}']
-            >>> settings._parse_path('WORD.{{ x.y }}')
-            ['WORD', '{{ x.y }}']
-            >>> settings._parse_path('WORD.{{ x.y.z }}XYZ')
-            ['WORD', '{{ x.y.z }}XYZ']
-
-        Interpolation groups *can* be wrapped in parentheses, but doing
-        so is redundant::
-
-            >>> settings._parse_path('WORD.({{ x.y.z }}XYZ)')
-            ['WORD', '{{ x.y.z }}XYZ']
-
-        Any segment that A) looks like an int and B) is *not* within
-        a (...) or {{ ... }} group will be converted to an int. Segments
-        that start with a leading "0" followed by other digits will not
-        be converted.
-
-        """
-        if not path:
-            raise ValueError("path cannot be empty")
-
-        i = 0
-        length = len(path)
-        stack = []
-        collector = []
-        segments = []
-        group = False
-        convert_name = self._convert_name
-
-        def append_segment():
-            segment = "".join(collector)
-            if not group:
-                segment = convert_name(segment)
-            segments.append(segment)
-            del collector[:]
-
-        while i < length:
-            c = path[i]
-
-            try:
-                d = path[i + 1]
-            except IndexError:
-                d = " "
-
-            if c == "." and not stack:
-                append_segment()
-                group = False
-            elif c == "(":
-                # Consume everything inside outer parentheses, including
-                # inner parentheses. We'll know we've reached the right
-                # outer paren when the stack is back to its height before
-                # entering the group.
-                stack_len = len(stack)
-                stack.append(c)
-                i += 1  # Skip outer left paren
-                while i < length:
-                    e = path[i]
-                    if e == "(":
-                        stack.append(e)
-                    elif e == ")":
-                        item = stack.pop()
-                        if item != "(":
-                            raise ValueError("Unclosed (...) in %s" % path)
-                        if len(stack) == stack_len:
-                            group = True
-                            break
-                    # Add char here so outer right paren isn't collected.
-                    collector.append(e)
-                    i += 1
-            elif c == "{" and d == "{":
-                stack.append("{{")
-                collector.append("{{")
-                i += 1
-            elif c == "}" and d == "}":
-                item = stack.pop()
-                if item != "{{":
-                    raise ValueError("Unclosed {{ ... }} in %s" % path)
-                collector.append("}}")
-                group = True
-                i += 1
-            else:
-                collector.append(c)
-
-            i += 1
+            if obj[segment] is not PLACEHOLDER:
+                return
+        else:
+            return
+        # Only create the default value when it's actually needed.
+        if isinstance(next_segment, int):
+            value = []
+        else:
+            value = Settings()
+        obj[segment] = value
 
-        if stack:
-            bracket = stack[-1]
-            close_bracket = ")" if bracket == "(" else "}}"
-            raise ValueError("Unclosed %s...%s in %s" % (bracket, close_bracket, path))
+    @staticmethod
+    def _parse_path(path):
+        """Parse ``path`` into a list of segments.
 
-        if collector:
-            append_segment()
+        See :func:`parse_path`.
 
-        return segments
+        """
+        return list(parse_path(path))
 
-    def _convert_name(self, name):
+    @staticmethod
+    def _convert_name(name):
         """Convert ``name`` to int if it looks like an int.
 
-        Otherwise, return it as is.
+        See :func:`convert_name`.
 
         """
-        if re.search(r"^\d+$", name):
-            if len(name) > 1 and name[0] == "0":
-                # Don't treat strings beginning with "0" as ints
-                return name
-            return int(name)
-        return name
+        return convert_name(name)
 
 
 class DottedAccessDict(dict, DottedAccessMixin):
@@ -353,9 +464,12 @@ class Settings(dict, DottedAccessMixin):
         self.update(*args, **kwargs)
 
     def __setitem__(self, name, value):
-        if isinstance(value, Mapping):
-            value = Settings(value)
-        super().__setitem__(name, value)
+        if isinstance(value, (dict, Mapping)):
+            # Don't rewrap (i.e., copy) a Settings object that's being
+            # reassigned to the same name.
+            if not (isinstance(value, Settings) and self.get(name) is value):
+                value = Settings(value)
+        dict.__setitem__(self, name, value)
 
     # Implementation of attribute access.
 
@@ -402,9 +516,9 @@ class Settings(dict, DottedAccessMixin):
             raise TypeError("update() takes at least 1 argument (0 given)")
         self = args[0]
         other = args[1] if len(args) >= 2 else ()
-        if isinstance(other, Mapping):
-            for name in other:
-                self[name] = other[name]
+        if isinstance(other, (dict, Mapping)):
+            for name, value in other.items():
+                self[name] = value
         elif hasattr(other, "keys"):
             for name in other.keys():
                 self[name] = other[name]
@@ -1,12 +1,19 @@
 """Strategies for reading from & writing to config files."""
+import copy
 import logging
 import os
+import sys
 from abc import ABCMeta, abstractmethod
 from configparser import NoSectionError, RawConfigParser
+from stat import S_ISREG
 
 from jsun import Decoder, DecodeError, Encoder
 
-from .exc import SettingsFileNotFoundError, SettingsFileSectionNotFoundError
+from .exc import (
+    LocalSettingsError,
+    SettingsFileNotFoundError,
+    SettingsFileSectionNotFoundError,
+)
 from .util import parse_file_name_and_section
 
 
@@ -20,6 +27,40 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+# Settings read by :meth:`Strategy.read_file`, keyed by strategy type,
+# file name, and section. Each entry also records the stamp of every
+# file in the ``extends`` chain so that it will be ignored if any of
+# those files has changed since it was read.
+_read_file_cache = {}
+
+# File type map built by :func:`get_file_type_map`. This is reset when
+# a new :class:`Strategy` subclass is defined. Note that it holds strong
+# references to the strategy types it contains.
+_file_type_map = None
+
+
+def _get_file_stamp(file_name):
+    """Get stamp for file that changes when the file is modified.
+
+    The stamp consists of the file's inode, size, mtime, and ctime. The
+    ctime is included because, unlike the mtime, it can't be restored
+    (e.g., by ``cp -p`` or ``rsync -t``), and the inode is included to
+    catch files that are replaced rather than modified in place.
+
+    Returns ``None`` if the file doesn't exist or isn't a regular file.
+    This does a single ``stat`` call, so it can be used in place of
+    ``os.path.isfile`` when the stamp is also needed.
+
+    """
+    try:
+        stat = os.stat(file_name)
+    except (OSError, ValueError):
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
 class RawValue(str):
 
     """Marker for values that couldn't be decoded when reading."""
@@ -29,6 +70,13 @@ class Strategy(metaclass=ABCMeta):
 
     file_types = ()
 
+    def __init_subclass__(cls, **kwargs):
+        global _file_type_map
+        super().__init_subclass__(**kwargs)
+        # Clear the cached file type map so that it will be rebuilt
+        # with the new strategy type.
+        _file_type_map = None
+
     @abstractmethod
     def get_defaults(self, file_name):
         """Get default settings from file.
@@ -80,36 +128,90 @@ class Strategy(metaclass=ABCMeta):
             section = self.get_default_section(file_name)
         return file_name, section
 
-    def read_file(self, file_name, section=None, _finalize=True):
-        """Read settings from config file."""
-        if _finalize:
-            file_name, section = self.parse_file_name_and_section(file_name, section)
+    def read_file(self, file_name, section=None):
+        """Read settings from config file.
 
-        if not os.path.isfile(file_name):
-            raise SettingsFileNotFoundError(file_name)
+        Results are cached per process. A cached result will be reused
+        until the file or any of the files it extends is modified. A
+        deep copy of the cached settings is returned so callers are free
+        to modify the result.
 
-        settings = {}
+        .. note:: Modifications are detected via file stamps (see
+            :func:`_get_file_stamp`). On file systems with coarse
+            timestamps, a file that's modified in place without changing
+            its size within the same timestamp tick as the previous read
+            won't be detected, and the stale cached settings will be
+            returned.
 
-        result = self._read_one_file(file_name, section)
-        file_settings, section_present, extends, extends_section = result
-
-        if extends:
-            if extends != file_name:
-                result = self.read_file(extends, extends_section, _finalize=False)
-                extends_settings, extends_section_present = result
-                section_present = section_present or extends_section_present
-                settings.update(extends_settings)
+        """
+        file_name, section = self.parse_file_name_and_section(file_name, section)
+        cache_key = (self.__class__, file_name, section)
+        entry = _read_file_cache.get(cache_key)
+        if entry is not None:
+            stamps, settings = entry
+            if all(_get_file_stamp(f) == stamp for f, stamp in stamps):
+                return copy.deepcopy(settings)
 
-        settings.update(file_settings)
+        stamps = []
+        settings, section_present = self._read_file(file_name, section, stamps)
 
-        if _finalize:
-            if not section_present:
-                raise SettingsFileSectionNotFoundError(section)
-        else:
-            return settings, section_present
+        if not section_present:
+            raise SettingsFileSectionNotFoundError(section)
 
+        _read_file_cache[cache_key] = (tuple(stamps), copy.deepcopy(settings))
         return settings
 
+    def _read_file(self, file_name, section, stamps):
+        """Read settings from config file and the files it extends.
+
+        The ``extends`` chain is followed iteratively and then the
+        settings from each file are merged, starting with the file at
+        the end of the chain. The stamp of each file that's read is
+        appended to ``stamps``.
+
+        Returns:
+            - Settings from the file and the files it extends.
+            - Whether the section is present in any of those files.
+
+        """
+        chain = []
+        seen = set()
+        section_present = False
+
+        while True:
+            if (file_name, section) in seen:
+                raise LocalSettingsError(
+                    f"Circular extends in {file_name} (section: {section})"
+                )
+            seen.add((file_name, section))
+
+            # Stat the file once, before reading it, so that if it's
+            # modified while being read the cache entry will be stale.
+            stamp = _get_file_stamp(file_name)
+            if stamp is None:
+                raise SettingsFileNotFoundError(file_name)
+
+            stamps.append((file_name, stamp))
+
+            result = self._read_one_file(file_name, section)
+            file_settings, file_section_present, extends, extends_section = result
+            chain.append(file_settings)
+            section_present = section_present or file_section_present
+
+            if not extends or extends == file_name:
+                break
+
+            file_name, section = extends, extends_section
+
+        # The settings from the last file in the chain are a new dict,
+        # so they can be updated in place rather than being copied into
+        # another new dict.
+        settings = chain.pop()
+        for file_settings in reversed(chain):
+            settings.update(file_settings)
+
+        return settings, section_present
+
     def _read_one_file(self, file_name, section, settings=None):
         """Read settings from a single config file."""
         if settings is None:
@@ -156,9 +258,10 @@ class Strategy(metaclass=ABCMeta):
 
         """
         decoded_items = {}
+        decode_value = self.decode_value
         for k, v in items:
             try:
-                v = self.decode_value(v)
+                v = decode_value(v)
             except ValueError:
                 v = RawValue(v)
             decoded_items[k] = v
@@ -187,8 +290,9 @@ class LocalSettingsConfigParser(RawConfigParser):
 
     def optionxform(self, option):
         # Don't alter option names; the default implementation lower
-        # cases them.
-        return option
+        # cases them. Names are interned since the same names tend to
+        # appear in multiple files (e.g., in an extends chain).
+        return sys.intern(option)
 
     def get_section(self, section):
         """Get section without defaults.
@@ -207,7 +311,7 @@ class INIStrategy(Strategy):
     file_types = ("ini",)
 
     def __init__(self):
-        # Cache parsers by file name
+        # Cache parsers by file name; see :meth:`get_parser`
         self._parser_cache = {}
 
     def get_defaults(self, file_name):
@@ -229,39 +333,64 @@ class INIStrategy(Strategy):
         file_name, section = self.parse_file_name_and_section(file_name, section)
         parser = self.make_parser()
         if os.path.exists(file_name):
-            with open(file_name) as fp:
-                parser.read_file(fp)
+            self.read_parser_file(parser, file_name)
         else:
             log.info("Creating new local settings file: %s", file_name)
         if section not in parser:
             log.info("Adding new section to %s: %s", file_name, section)
             parser.add_section(section)
-        sorted_keys = sorted(settings.keys())
-        for name in sorted_keys:
-            value = settings[name]
-            parser[section][name] = value
+        sorted_items = sorted(settings.items(), key=lambda item: item[0])
+        section_items = parser[section]
+        for name, value in sorted_items:
+            section_items[name] = value
         with open(file_name, "w") as fp:
             parser.write(fp)
-        for name in sorted_keys:
-            value = settings[name]
+        _read_file_cache.clear()
+        self._parser_cache.pop(file_name, None)
+        for name, value in sorted_items:
             log.info("Saved %s to %s as: %s", name, file_name, value)
 
     def get_default_section(self, file_name):
         """Returns first non-DEFAULT section; falls back to DEFAULT."""
-        if not os.path.isfile(file_name):
+        stamp = _get_file_stamp(file_name)
+        if stamp is None:
             return "DEFAULT"
-        parser = self.get_parser(file_name)
+        parser = self.get_parser(file_name, stamp)
         sections = parser.sections()
         section = sections[0] if len(sections) > 0 else "DEFAULT"
         return section
 
-    def get_parser(self, file_name):
-        if file_name not in self._parser_cache:
-            parser = self.make_parser()
-            with open(file_name) as fp:
-                parser.read_file(fp)
-            self._parser_cache[file_name] = parser
-        return self._parser_cache[file_name]
+    def get_parser(self, file_name, stamp=None):
+        """Get parser for file.
+
+        Parsers are cached by file name along with the file's stamp. A
+        cached parser will be reused until the file is modified. If the
+        caller already has the file's stamp, it can be passed to avoid
+        another ``stat`` call.
+
+        """
+        if stamp is None:
+            stamp = _get_file_stamp(file_name)
+            if stamp is None:
+                raise SettingsFileNotFoundError(file_name)
+        entry = self._parser_cache.get(file_name)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        parser = self.make_parser()
+        self.read_parser_file(parser, file_name)
+        self._parser_cache[file_name] = (stamp, parser)
+        return parser
+
+    def read_parser_file(self, parser, file_name):
+        """Read file into parser.
+
+        The file is read in a single call and then parsed from memory,
+        rather than having the parser pull it from disk line by line.
+
+        """
+        with open(file_name) as fp:
+            contents = fp.read()
+        parser.read_string(contents, source=file_name)
 
     def make_parser(self):
         return LocalSettingsConfigParser()
@@ -271,6 +400,9 @@ class INIJSONStrategy(INIStrategy):
 
     file_types = ("cfg",)
 
+    # Values that are decoded without going through the decoder
+    literal_values = {"true": True, "false": False, "null": None}
+
     def __init__(self):
         super().__init__()
         self._decoder = Decoder(strict=True, object_converter=None)
@@ -279,6 +411,12 @@ class INIJSONStrategy(INIStrategy):
         self._encode = self._encoder.encode
 
     def decode_value(self, value):
+        # Short circuit for literals and non-negative ints, which are
+        # very common and relatively slow to decode.
+        if value in self.literal_values:
+            return self.literal_values[value]
+        if value.isdecimal() and value.isascii() and (value[0] != "0" or value == "0"):
+            return int(value)
         try:
             value = self._decode(value)
         except DecodeError as exc:
@@ -311,7 +449,20 @@ def get_strategy_types():
 
 
 def get_file_type_map():
-    """Map file types (extensions) to strategy types."""
+    """Map file types (extensions) to strategy types.
+
+    The map is cached. The cache is cleared whenever a new
+    :class:`Strategy` subclass is defined. The returned map is shared
+    and shouldn't be modified.
+
+    .. note:: The cached map holds strong references to the strategy
+        types in it, so a strategy type that's no longer referenced
+        elsewhere will stay registered until the cache is cleared.
+
+    """
+    global _file_type_map
+    if _file_type_map is not None:
+        return _file_type_map
     file_type_map = {}
     for strategy_type in get_strategy_types():
         for ext in strategy_type.file_types:
@@ -320,6 +471,7 @@ def get_file_type_map():
                     f"File type {ext} already registered to " f"{file_type_map[ext]}"
                 )
             file_type_map[ext] = strategy_type
+    _file_type_map = file_type_map
     return file_type_map
 
 
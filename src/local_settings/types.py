@@ -4,6 +4,9 @@ from .exc import NoDefaultError, NoValueError, DefaultValueError
 from .util import NO_DEFAULT
 
 
+_json_scalar_types = (str, int, float, bool, type(None))
+
+
 class LocalSetting:
 
     """Used to mark settings that should be set in the local environment.
@@ -27,13 +30,16 @@ class LocalSetting:
             else:
                 if callable(default):
                     default = default()
-                try:
-                    dumps(default)
-                except TypeError as exc:
-                    raise TypeError(
-                        f"{exc}\nDefault value for LocalSetting must "
-                        f"be JSON serializable"
-                    )
+                # Skip the serialization check for the most common
+                # types of default values, which are always valid.
+                if default.__class__ not in _json_scalar_types:
+                    try:
+                        dumps(default)
+                    except TypeError as exc:
+                        raise TypeError(
+                            f"{exc}\nDefault value for LocalSetting must "
+                            f"be JSON serializable"
+                        )
         self.prompt = prompt
         self.doc = doc
         self.validator = validator
@@ -48,7 +54,7 @@ class LocalSetting:
         return self._value is not NO_DEFAULT or self.has_default
 
     def _get_default(self):
-        if self.derived_default:
+        if self.derived_default is not NO_DEFAULT:
             default = self.derived_default.value
         else:
             default = self._default
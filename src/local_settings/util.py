@@ -1,21 +1,46 @@
 import importlib
 import io
 import os
+from functools import lru_cache
 
 import dotenv
 
 
-NO_DEFAULT = type(
-    "NO_DEFAULT",
-    (),
-    {
-        "__nonzero__": (lambda self: False),  # Python 2
-        "__bool__": (lambda self: False),  # Python 3
-        "__str__": (lambda self: self.__class__.__name__),
-        "__repr__": (lambda self: str(self)),
-        "__copy__": (lambda self: self),
-    },
-)()
+class _NoDefault:
+
+    """Type of the :data:`NO_DEFAULT` sentinel.
+
+    Copying or pickling the sentinel returns the sentinel itself so
+    identity checks against it keep working.
+
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "NO_DEFAULT"
+
+    __str__ = __repr__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return "NO_DEFAULT"
+
+
+NO_DEFAULT = _NoDefault()
+
+
+# Default file names built by :func:`get_default_file_names` along with
+# the file type map they were built from.
+_default_file_names = None
 
 
 def get_file_name():
@@ -47,10 +72,20 @@ def get_file_name():
 
 
 def get_default_file_names():
-    """Get default file names for all loading strategies, sorted."""
+    """Get default file names for all loading strategies, sorted.
+
+    The names are cached along with the file type map they were built
+    from, so they'll be rebuilt if new strategy types are added.
+
+    """
+    global _default_file_names
     from .strategy import get_file_type_map  # noqa: Avoid circular import
 
-    return sorted(f"local.{ext}" for ext in get_file_type_map())
+    file_type_map = get_file_type_map()
+    if _default_file_names is None or _default_file_names[0] is not file_type_map:
+        names = sorted(f"local.{ext}" for ext in file_type_map)
+        _default_file_names = (file_type_map, tuple(names))
+    return list(_default_file_names[1])
 
 
 def parse_file_name_and_section(
@@ -73,8 +108,13 @@ def parse_file_name_and_section(
     section parsed out of the file name.
 
     """
-    if "#" in file_name:
-        file_name, parsed_section = file_name.rsplit("#", 1)
+    # Fast path for the common case of a plain path and section
+    if section and not extender and "#" not in file_name and ":" not in file_name:
+        return file_name, section
+
+    head, sep, parsed_section = file_name.rpartition("#")
+    if sep:
+        file_name = head
     else:
         parsed_section = None
 
@@ -119,12 +159,15 @@ def abs_path(path, relative_to=None):
     return path
 
 
+@lru_cache(maxsize=128)
 def asset_path(path):
-    """Get absolute path from asset spec and normalize it."""
-    if ":" in path:
-        package_name, rel_path = path.split(":", 1)
-    else:
-        package_name, rel_path = path, ""
+    """Get absolute path from asset spec and normalize it.
+
+    Results are cached since a package's location won't change once
+    it has been imported.
+
+    """
+    package_name, _, rel_path = path.partition(":")
 
     try:
         package = importlib.import_module(package_name)
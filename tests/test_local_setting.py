@@ -37,6 +37,15 @@ class TestLocalSetting(unittest.TestCase):
         self.assertEqual(default_setting.value, 1)
         self.assertEqual(setting.value, 2)
 
+    def test_local_setting_is_hashed_by_identity(self):
+        # Local settings are used as registry keys and their values are
+        # set while they're in the registry.
+        setting = LocalSetting(default=1)
+        registry = {setting: "SETTING"}
+        setting.value = 2
+        self.assertEqual(registry[setting], "SETTING")
+        self.assertNotIn(LocalSetting(default=1), registry)
+
     def test_local_setting_with_validator(self):
         setting = LocalSetting(validator=lambda v: isinstance(v, int))
         with self.assertRaises(ValueError):
@@ -2,7 +2,7 @@ import doctest
 import unittest
 
 import local_settings.settings
-from local_settings.settings import Settings
+from local_settings.settings import Settings, convert_name, parse_path
 
 
 def load_tests(loader, tests, ignore):
@@ -51,6 +51,33 @@ class TestPathParsing(unittest.TestCase):
         segments = self.settings._parse_path("XYZ.(a).(b.b).c.(d)")
         self.assertEqual(segments, ["XYZ", "a", "b.b", "c", "d"])
 
+    def test_parsed_paths_are_cached(self):
+        self.assertIs(parse_path("XYZ.(a.b).0"), parse_path("XYZ.(a.b).0"))
+
+    def test_modifying_parsed_path_does_not_modify_cached_path(self):
+        segments = self.settings._parse_path("XYZ.abc")
+        segments.append("x")
+        self.assertEqual(self.settings._parse_path("XYZ.abc"), ["XYZ", "abc"])
+
+
+class TestConvertName(unittest.TestCase):
+    def test_int(self):
+        self.assertEqual(convert_name("0"), 0)
+        self.assertEqual(convert_name("10"), 10)
+
+    def test_leading_zero_is_not_converted(self):
+        self.assertEqual(convert_name("01"), "01")
+
+    def test_non_int_is_not_converted(self):
+        self.assertEqual(convert_name("LOGGING"), "LOGGING")
+        self.assertEqual(convert_name("1x"), "1x")
+        self.assertEqual(convert_name("-1"), "-1")
+        self.assertEqual(convert_name(""), "")
+
+    def test_non_decimal_digit_is_not_converted(self):
+        # str.isdigit() is True for these, but int() can't parse them
+        self.assertEqual(convert_name("\u00b2"), "\u00b2")
+
 
 class TestSetItem(unittest.TestCase):
     def setUp(self):
@@ -80,6 +107,19 @@ class TestSetItem(unittest.TestCase):
         self.assertIn("x", self.settings)
         self.assertEqual(x, 1)
 
+    def test_setitem_wraps_dict(self):
+        d = {"b": {"c": 1}}
+        self.settings["a"] = d
+        self.assertIsInstance(self.settings["a"], Settings)
+        self.assertIsInstance(self.settings["a"]["b"], Settings)
+        self.assertIsNot(self.settings["a"], d)
+
+    def test_reassigning_settings_does_not_copy(self):
+        self.settings["a"] = {"b": 1}
+        a = self.settings["a"]
+        self.settings["a"] = a
+        self.assertIs(self.settings["a"], a)
+
 
 class TestGetItem(unittest.TestCase):
     def setUp(self):
@@ -157,3 +197,21 @@ class TestDotted(unittest.TestCase):
         self.assertEqual(self.settings.get_dotted("{{}}"), "x")
         self.assertIn("{{}}", self.settings)
         self.assertEqual(self.settings["{{}}"], "x")
+
+    def test_contains_dotted_with_list_index(self):
+        self.settings.set_dotted("x.1", "x")
+        self.assertTrue(self.settings.contains_dotted("x.1"))
+        self.assertFalse(self.settings.contains_dotted("x.2"))
+        self.assertFalse(self.settings.contains_dotted("x.y"))
+        self.assertFalse(self.settings.contains_dotted("x.1.y"))
+
+    def test_contains_dotted_with_other_item_access_type(self):
+        class ItemAccess:
+            def __getitem__(self, key):
+                return {"a": {"b": 1}}[key]
+
+        self.settings["x"] = ItemAccess()
+        self.assertTrue(self.settings.contains_dotted("x.a"))
+        self.assertTrue(self.settings.contains_dotted("x.a.b"))
+        self.assertFalse(self.settings.contains_dotted("x.b"))
+        self.assertFalse(self.settings.contains_dotted("x.a.c"))
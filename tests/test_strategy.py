@@ -1,8 +1,152 @@
 import doctest
+import os
+import tempfile
+import unittest
+from unittest import mock
 
 import local_settings.strategy
+from local_settings.exc import LocalSettingsError, SettingsFileNotFoundError
+from local_settings.strategy import (
+    INIJSONStrategy,
+    INIStrategy,
+    get_strategy_types,
+    guess_strategy_type,
+)
 
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(local_settings.strategy))
     return tests
+
+
+class TestReadFileCache(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_file_name = os.path.join(temp_dir.name, "base.cfg")
+        self.file_name = os.path.join(temp_dir.name, "local.cfg")
+        self.root_file_name = os.path.join(temp_dir.name, "root.cfg")
+        self.write(self.base_file_name, '[test]\nA = [1]\nB = "base"\n')
+        self.write(self.file_name, '[test]\nextends = "base.cfg"\nB = "local"\n')
+
+    def write(self, file_name, contents):
+        with open(file_name, "w") as fp:
+            fp.write(contents)
+
+    def test_cached_result_is_a_copy(self):
+        settings = INIJSONStrategy().read_file(self.file_name)
+        self.assertEqual(settings, {"A": [1], "B": "local"})
+        settings["A"].append(2)
+        settings = INIJSONStrategy().read_file(self.file_name)
+        self.assertEqual(settings, {"A": [1], "B": "local"})
+
+    def test_extends_chain(self):
+        self.write(self.base_file_name, '[test]\nextends = "root.cfg"\nB = "base"\n')
+        self.write(self.root_file_name, '[test]\nA = [1]\nB = "root"\nC = "root"\n')
+        settings = INIJSONStrategy().read_file(self.file_name)
+        self.assertEqual(settings, {"A": [1], "B": "local", "C": "root"})
+
+    def test_circular_extends(self):
+        self.write(self.base_file_name, '[test]\nextends = "local.cfg"\n')
+        strategy = INIJSONStrategy()
+        self.assertRaises(LocalSettingsError, strategy.read_file, self.file_name)
+
+    def test_same_size_modification_with_restored_mtime_invalidates_cache(self):
+        INIJSONStrategy().read_file(self.file_name)
+        stat = os.stat(self.file_name)
+        self.write(self.file_name, '[test]\nextends = "base.cfg"\nB = "LOCAL"\n')
+        os.utime(self.file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        settings = INIJSONStrategy().read_file(self.file_name)
+        self.assertEqual(settings, {"A": [1], "B": "LOCAL"})
+
+    def test_modifying_extended_file_invalidates_cache(self):
+        INIJSONStrategy().read_file(self.file_name)
+        self.write(self.base_file_name, '[test]\nA = [1, 2, 3]\nB = "base"\n')
+        settings = INIJSONStrategy().read_file(self.file_name)
+        self.assertEqual(settings, {"A": [1, 2, 3], "B": "local"})
+
+
+class TestParserCache(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_name = os.path.join(temp_dir.name, "local.cfg")
+        with open(self.file_name, "w") as fp:
+            fp.write("[test]\nA = 1\n")
+
+    def test_parser_is_cached(self):
+        strategy = INIJSONStrategy()
+        parser = strategy.get_parser(self.file_name)
+        self.assertIs(strategy.get_parser(self.file_name), parser)
+
+    def test_modifying_file_invalidates_cached_parser(self):
+        strategy = INIJSONStrategy()
+        strategy.get_parser(self.file_name)
+        with open(self.file_name, "w") as fp:
+            fp.write("[test]\nA = 1\nB = 2\n")
+        parser = strategy.get_parser(self.file_name)
+        self.assertEqual(dict(parser.get_section("test")), {"A": "1", "B": "2"})
+
+    def test_missing_file(self):
+        strategy = INIJSONStrategy()
+        os.remove(self.file_name)
+        self.assertRaises(
+            SettingsFileNotFoundError, strategy.get_parser, self.file_name
+        )
+
+    def test_write_settings_invalidates_cached_parser(self):
+        strategy = INIJSONStrategy()
+        strategy.get_parser(self.file_name)
+        strategy.write_settings({"B": "2"}, self.file_name, "test")
+        parser = strategy.get_parser(self.file_name)
+        self.assertEqual(dict(parser.get_section("test")), {"A": "1", "B": "2"})
+
+
+class TestGuessStrategyType(unittest.TestCase):
+    def test_guess_strategy_type(self):
+        self.assertIs(guess_strategy_type("local.cfg"), INIJSONStrategy)
+        self.assertIs(guess_strategy_type("ini"), INIStrategy)
+        self.assertIsNone(guess_strategy_type("local.xyz"))
+
+    def test_new_strategy_type_is_found(self):
+        # A stand-in type is used rather than a real Strategy subclass,
+        # which couldn't be unregistered after the test.
+        test_strategy_type = type(
+            "TestStrategy", (), {"file_types": ("test-strategy",)}
+        )
+        strategy_types = get_strategy_types() + [test_strategy_type]
+        with mock.patch.object(local_settings.strategy, "_file_type_map", None):
+            with mock.patch.object(
+                local_settings.strategy,
+                "get_strategy_types",
+                return_value=strategy_types,
+            ):
+                strategy_type = guess_strategy_type("local.test-strategy")
+        self.assertIs(strategy_type, test_strategy_type)
+        self.assertIsNone(guess_strategy_type("local.test-strategy"))
+
+    def test_defining_strategy_type_resets_file_type_map(self):
+        with mock.patch.object(local_settings.strategy, "_file_type_map", {}):
+            INIStrategy.__init_subclass__()
+            self.assertIsNone(local_settings.strategy._file_type_map)
+
+
+class TestINIJSONStrategyDecodeValue(unittest.TestCase):
+    def setUp(self):
+        self.strategy = INIJSONStrategy()
+
+    def test_decode_literals(self):
+        self.assertIs(self.strategy.decode_value("true"), True)
+        self.assertIs(self.strategy.decode_value("false"), False)
+        self.assertIsNone(self.strategy.decode_value("null"))
+
+    def test_decode_ints(self):
+        self.assertEqual(self.strategy.decode_value("0"), 0)
+        self.assertEqual(self.strategy.decode_value("123"), 123)
+        self.assertEqual(self.strategy.decode_value("-1"), -1)
+
+    def test_int_with_leading_zero_is_not_decoded(self):
+        self.assertRaises(ValueError, self.strategy.decode_value, "01")
+
+    def test_non_ascii_digits_are_not_decoded(self):
+        self.assertRaises(ValueError, self.strategy.decode_value, "\u0661")
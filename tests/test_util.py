@@ -1,13 +1,20 @@
+import copy
 import os
+import pickle
 import unittest
 
-from local_settings.util import NO_DEFAULT, get_file_name
+from local_settings.util import NO_DEFAULT, asset_path, get_file_name
 
 
 class TestUtil(unittest.TestCase):
     def test_NO_DEFAULT_is_False(self):
         self.assertFalse(NO_DEFAULT)
 
+    def test_NO_DEFAULT_is_preserved_by_copy_and_pickle(self):
+        self.assertIs(copy.copy(NO_DEFAULT), NO_DEFAULT)
+        self.assertIs(copy.deepcopy([NO_DEFAULT])[0], NO_DEFAULT)
+        self.assertIs(pickle.loads(pickle.dumps(NO_DEFAULT)), NO_DEFAULT)
+
     def test_default_file_name(self):
         os.chdir(os.path.dirname(__file__))
         os.environ.pop("LOCAL_SETTINGS_FILE", None)
@@ -18,3 +25,11 @@ class TestUtil(unittest.TestCase):
         os.environ["LOCAL_SETTINGS_FILE"] = "pants.cfg"
         file_name = get_file_name()
         self.assertEqual(file_name, "pants.cfg")
+
+    def test_asset_path(self):
+        path = asset_path("tests:local.cfg")
+        expected_path = os.path.join(os.path.dirname(__file__), "local.cfg")
+        self.assertEqual(path, os.path.normpath(expected_path))
+
+    def test_asset_path_for_missing_package(self):
+        self.assertRaises(ValueError, asset_path, "no_such_package:local.cfg")